@@ -1,17 +1,124 @@
+import marshal
 import pathlib
-from typing import TYPE_CHECKING
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING
 
-from pydantic_yaml import parse_yaml_file_as
+if TYPE_CHECKING:
+    from .model import App, Config, Game, Screen
 
-from .model import Config
+__config_path: pathlib.Path = pathlib.Path(__file__).parent / "config.yaml"
+__model_path: pathlib.Path = pathlib.Path(__file__).parent / "model.py"
+__cache_path: pathlib.Path = pathlib.Path(__file__).parent / "__pycache__" / "config.yaml.cache"
+__cache_version: int = 2
 
-if TYPE_CHECKING:
-    from .model import App, Game, Screen
+
+def _stats(source_paths: List[pathlib.Path]) -> List[Tuple[int, int]]:
+    stats = [path.stat() for path in source_paths]
+    return [(stat.st_mtime_ns, stat.st_size) for stat in stats]
+
+
+def _digest(sources: List[bytes]) -> str:
+    import hashlib
+
+    sha256 = hashlib.sha256()
+    for source in sources:
+        sha256.update(source)
+    return sha256.hexdigest()
+
+
+def _read_cache(source_paths: List[pathlib.Path], cache_path: pathlib.Path) -> Dict[str, Any] | None:
+    """
+    return the cached config data if it still matches config.yaml and model.py, checking mtime/size first and the
+    content hash only when those changed (e.g. after a checkout touched the files)
+    """
+    try:
+        version, stats, digest, data = marshal.loads(cache_path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != __cache_version:
+        return None
+    current_stats = _stats(source_paths)
+    if current_stats == stats:
+        return data
+    if _digest([path.read_bytes() for path in source_paths]) == digest:
+        _write_cache(cache_path, current_stats, digest, data)
+        return data
+    return None
+
+
+def _write_cache(cache_path: pathlib.Path, stats: List[Tuple[int, int]], digest: str, data: Dict[str, Any]):
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        cache_path.write_bytes(marshal.dumps((__cache_version, stats, digest, data)))
+    except OSError:
+        # read-only checkout, just parse the yaml again next time
+        pass
+
+
+def _parse_config(config_path: pathlib.Path, cache_path: pathlib.Path, model_path: pathlib.Path) -> 'Config':
+    # pydantic_yaml pulls in the yaml parser, only needed when the cache is stale
+    from pydantic_yaml import parse_yaml_raw_as
+
+    from .model import Config
+
+    # key the cache on exactly the bytes that get parsed, stats first so a save in between only costs a re-hash
+    stats = _stats([config_path, model_path])
+    sources = [config_path.read_bytes(), model_path.read_bytes()]
+    config = parse_yaml_raw_as(Config, sources[0].decode())
+    _write_cache(cache_path, stats, _digest(sources), config.model_dump(mode='json'))
+    return config
+
+
+def load_config_data(config_path: pathlib.Path = __config_path, cache_path: pathlib.Path = __cache_path,
+                     model_path: pathlib.Path = __model_path) -> Dict[str, Any]:
+    """
+    return the validated config as plain data, read from the cache without importing pydantic when it is fresh
+    """
+    data = _read_cache([config_path, model_path], cache_path)
+    if data is not None:
+        return data
+    return _parse_config(config_path, cache_path, model_path).model_dump(mode='json')
+
+
+def load_config(config_path: pathlib.Path = __config_path, cache_path: pathlib.Path = __cache_path,
+                model_path: pathlib.Path = __model_path, data: Dict[str, Any] | None = None) -> 'Config':
+    """
+    build the Config model from already loaded data when given, re-parsing the yaml if it no longer validates
+    """
+    from pydantic import ValidationError
+
+    from .model import Config
+
+    if data is None:
+        data = _read_cache([config_path, model_path], cache_path)
+    if data is not None:
+        try:
+            return Config.model_validate(data)
+        except ValidationError:
+            pass
+    return _parse_config(config_path, cache_path, model_path)
 
 
 class AppConfig:
     def __init__(self):
-        self.config: 'Config' = parse_yaml_file_as(Config, pathlib.Path(__file__).parent / "config.yaml")
+        self.__data: Dict[str, Any] | None = None
+        self.__config: 'Config | None' = None
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """
+        plain dict of the config, enough for the window and tile sizes without loading the pydantic models
+        """
+        if self.__data is None:
+            self.__data = load_config_data()
+        return self.__data
+
+    @property
+    def config(self) -> 'Config':
+        if self.__config is None:
+            # validate the same data Screen and Tile were sized from instead of loading the files again
+            self.__config = load_config(data=self.data)
+            self.__data = self.__config.model_dump(mode='json')
+        return self.__config
 
     @property
     def app(self) -> 'App':
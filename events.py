@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import Tuple, TYPE_CHECKING
 
 import pygame
 
@@ -11,6 +11,9 @@ if TYPE_CHECKING:
     from game.map import Map
 
 
+DRAG_THRESHOLD = 4
+
+
 class ClickMode(Enum):
     NOTHING = 1
     SELECTED = 2
@@ -21,6 +24,10 @@ class EventHandler:
     _instance = None
     click_mode = ClickMode.NOTHING
     selected_unit = None
+    hovered_unit = None
+    drag_start = None
+    drag_rect = None
+    selection_rect = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -31,7 +38,7 @@ class EventHandler:
         pass
 
     class ClickEvent:
-        def __init__(self, tile: 'Tile', game_map: 'Map'):
+        def __init__(self, tile: 'Tile | None', game_map: 'Map'):
             self.tile = tile
             self.game_map = game_map
 
@@ -61,7 +68,7 @@ class EventHandler:
                 self.game_map.mark_move_range(reachable_tiles)
 
     class Move(ClickEvent):
-        def __init__(self, tile: 'Tile', game_map: 'Map'):
+        def __init__(self, tile: 'Tile | None', game_map: 'Map'):
             EventHandler.ClickEvent.__init__(self, tile, game_map)
 
         def execute(self):
@@ -86,20 +93,57 @@ class EventHandler:
             if type(self.unit) is Character:
                 self.unit.on_hit(1)
 
-    def click(self, game_map: 'Map'):
-        tile = Tile.from_screen_coordinate(*pygame.mouse.get_pos())
-        click_event = self.get_click_event(game_map, tile)
+    def click(self, game_map: 'Map', pos: Tuple[int, int]):
+        click_event = self.get_click_event(game_map, *pos)
         click_event.execute()
 
-    def get_click_event(self, game_map: 'Map', tile: 'Tile'):
-        click_event = EventHandler.ClickEvent(tile, game_map)
-        clicked_unit = game_map[tile]
+    def hover(self, game_map: 'Map', pos: Tuple[int, int]):
+        # cheap every frame, the index caches the last point until the board version changes
+        EventHandler.hovered_unit = game_map.hit_test.unit_at(*pos)
+
+    def press(self, pos: Tuple[int, int]):
+        EventHandler.drag_start = pos
+
+    def drag(self, pos: Tuple[int, int]):
+        if EventHandler.drag_start is None:
+            return
+        start_x, start_y = EventHandler.drag_start
+        if EventHandler.drag_rect is None and max(abs(pos[0] - start_x), abs(pos[1] - start_y)) < DRAG_THRESHOLD:
+            return
+        EventHandler.drag_rect = pygame.Rect(min(start_x, pos[0]), min(start_y, pos[1]),
+                                             abs(pos[0] - start_x) + 1, abs(pos[1] - start_y) + 1)
+
+    def release(self, game_map: 'Map', pos: Tuple[int, int]):
+        if EventHandler.drag_start is None:
+            return
+        if EventHandler.drag_rect is None:
+            # a press without dragging is a click, which also clears the previous drag selection
+            EventHandler.selection_rect = None
+            self.click(game_map, pos)
+        else:
+            self.drag(pos)
+            EventHandler.selection_rect = EventHandler.drag_rect
+        EventHandler.drag_start = None
+        EventHandler.drag_rect = None
+
+    @staticmethod
+    def drag_select(game_map: 'Map') -> Tuple['Unit', ...]:
+        rect = EventHandler.drag_rect or EventHandler.selection_rect
+        return game_map.hit_test.units_in_rect(rect) if rect else ()
+
+    def get_click_event(self, game_map: 'Map', x: int, y: int):
+        click_event = EventHandler.ClickEvent(None, game_map)
+        cell = game_map.hit_test.cell_at(x, y)
+        if cell is None:
+            return click_event
+        clicked_unit = game_map.hit_test.unit_at(x, y)
         if clicked_unit:
             self.click_mode = ClickMode.SELECTED
             click_event = EventHandler.Select(clicked_unit, game_map)
-            # click_event = EventHandler.Attack(clicked_unit, game_map, tile)
+            # click_event = EventHandler.Attack(clicked_unit, game_map, clicked_unit.tile)
         else:
             if self.click_mode == ClickMode.SELECTED:
                 self.click_mode = ClickMode.MOVING
-                click_event = EventHandler.Move(tile, game_map)
+                tile_x, tile_y = cell
+                click_event = EventHandler.Move(Tile(x=tile_x, y=tile_y), game_map)
         return click_event
@@ -32,7 +32,7 @@ class GameFactory(metaclass=ABCMeta):
 class BackgroundFactory(GameFactory):
 
     def create_unit(self, tile: 'Tile') -> 'Unit':
-        return Unit(tile=tile, image=ImageLoader.random_load(background_images))
+        return Unit(tile=tile, image=ImageLoader.random_load(background_images()))
 
 
 class MoveRangeFactory(GameFactory):
@@ -44,13 +44,13 @@ class MoveRangeFactory(GameFactory):
 class CharacterFactory(GameFactory):
 
     def create_unit(self, tile: 'Tile') -> 'Character':
-        return Character(tile=tile, images=[ImageLoader.random_load(character_images)])
+        return Character(tile=tile, images=[ImageLoader.random_load(character_images())])
 
 
 class TerrainFactory(GameFactory):
 
     def create_unit(self, tile: 'Tile') -> 'Unit':
-        return Unit(tile=tile, image=ImageLoader.random_load(background_images), layer=UnitLayer.Terrain,
+        return Unit(tile=tile, image=ImageLoader.random_load(background_images()), layer=UnitLayer.Terrain,
                     is_block=random.Random().randint(1, 50) % 2 == 0)
 
 
@@ -0,0 +1,88 @@
+from typing import Dict, Iterable, Iterator, List, Tuple, TYPE_CHECKING
+
+from pygame import Rect
+
+from config.loader import app_config
+from game.tile import Tile
+from game.units import UnitLayer
+
+if TYPE_CHECKING:
+    from game.units import Unit
+
+
+class HitTestIndex:
+    """
+    HitTestIndex maps screen pixels straight to grid cells and the top selectable unit, the per cell unit lists are
+    rebuilt only when the board version changes so it is cheap enough to query on every mouse motion
+    """
+
+    def __init__(self):
+        self.__columns: int = app_config.game.tiles.width
+        self.__rows: int = app_config.game.tiles.height
+        self.__selectable_layers = {layer.value for layer in UnitLayer.selectable_layers()}
+        self.__version: int = -1
+        self.__cells: Dict[Tuple[int, int], List['Unit']] = {}
+        self.__last_point: Tuple[int, int, int] | None = None
+        self.__last_point_unit: 'Unit | None' = None
+        self.__last_rect: Tuple[int, int, int, int, int] | None = None
+        self.__last_rect_units: Tuple['Unit', ...] = ()
+
+    def cell_at(self, x: int, y: int) -> Tuple[int, int] | None:
+        column, row = int(x // Tile.width), int(y // Tile.height)
+        if x < 0 or y < 0 or column >= self.__columns or row >= self.__rows:
+            return None
+        return column, row
+
+    def __cells_overlapping(self, rect: Rect) -> Iterator[Tuple[int, int]]:
+        left = max(int(rect.left // Tile.width), 0)
+        top = max(int(rect.top // Tile.height), 0)
+        right = min(int((rect.right - 1) // Tile.width), self.__columns - 1)
+        bottom = min(int((rect.bottom - 1) // Tile.height), self.__rows - 1)
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                yield column, row
+
+    def rebuild(self, units: Iterable['Unit'], version: int):
+        if version == self.__version:
+            return
+        cells: Dict[Tuple[int, int], List['Unit']] = {}
+        for unit in units:
+            if unit.layer in self.__selectable_layers:
+                # file the unit under every cell its sprite covers, not only its own tile
+                for cell in self.__cells_overlapping(unit.rect):
+                    cells.setdefault(cell, []).append(unit)
+        # topmost first, later added units win on the same layer like Map.__getitem__
+        for cell_units in cells.values():
+            cell_units.reverse()
+            cell_units.sort(key=lambda unit: unit.layer, reverse=True)
+        self.__cells = cells
+        self.__version = version
+        self.__last_point = None
+        self.__last_rect = None
+
+    def unit_at(self, x: int, y: int) -> 'Unit | None':
+        if self.__last_point == (x, y, self.__version):
+            return self.__last_point_unit
+        cell = self.cell_at(x, y)
+        unit = None
+        if cell is not None:
+            unit = next((unit for unit in self.__cells.get(cell, []) if unit.rect.collidepoint(x, y)), None)
+        self.__last_point = (x, y, self.__version)
+        self.__last_point_unit = unit
+        return unit
+
+    def units_in_rect(self, rect: Rect) -> Tuple['Unit', ...]:
+        rect = rect.clip(Rect(0, 0, self.__columns * Tile.width, self.__rows * Tile.height))
+        key = (rect.x, rect.y, rect.width, rect.height, self.__version)
+        if self.__last_rect == key:
+            return self.__last_rect_units
+        # a unit spanning several cells shows up once, in the order it is first reached
+        units: Dict['Unit', None] = {}
+        if rect.width and rect.height:
+            for cell in self.__cells_overlapping(rect):
+                unit = next((unit for unit in self.__cells.get(cell, []) if unit.rect.colliderect(rect)), None)
+                if unit:
+                    units[unit] = None
+        self.__last_rect = key
+        self.__last_rect_units = tuple(units)
+        return self.__last_rect_units
@@ -1,11 +1,12 @@
 import random
 from collections import defaultdict, deque
-from typing import Sequence, Tuple, List, Any, Dict, Generator, TYPE_CHECKING
+from typing import Sequence, Tuple, List, Any, Dict, Generator, Iterable, TYPE_CHECKING
 
 import pygame
 
 from config.loader import app_config
 from game.factories import unit_factory, UnitType
+from game.hit_test import HitTestIndex
 from game.tile import Tile
 from game.units import UnitLayer
 
@@ -23,6 +24,9 @@ class Map:
         self.__units = defaultdict(list)
         self.__surface = surface
         self.__background = pygame.sprite.LayeredUpdates()
+        # bumped whenever a unit is added, removed or moved so cached lookups know when to refresh
+        self.__version = 0
+        self.__hit_test = HitTestIndex()
         self.add(unit_factory(UnitType.BACKGROUND).generate(self.__config_game_tiles()))
 
     @staticmethod
@@ -39,15 +43,25 @@ class Map:
                  UnitLayer(unit.layer) in UnitLayer.selectable_layers()]
         return units[-1] if len(units) else None
 
+    @property
+    def hit_test(self) -> 'HitTestIndex':
+        self.__hit_test.rebuild(self.__background, self.__version)
+        return self.__hit_test
+
     def show(self):
         self.__background.update()
         self.__background.draw(self.__surface)
 
+    def highlight(self, rects: Iterable[pygame.Rect], color: pygame.Color):
+        for rect in rects:
+            pygame.draw.rect(self.__surface, color, rect, 2)
+
     def add(self, units: Sequence[pygame.sprite], **kwargs):
         for unit in units:
             unit.subscribe(self)
             self.__units[unit.tile].append(unit)
         self.__background.add(units, **kwargs)
+        self.__version += 1
 
     def mark_move_range(self, tiles: List['Tile']):
         move_ranges = unit_factory(UnitType.MOVE_RANGE).generate(tiles)
@@ -64,6 +78,7 @@ class Map:
             unit.unsubscribe(self)
             self.__units[unit.tile].remove(unit)
         self.__background.remove(units)
+        self.__version += 1
 
     def __available_config_game_tiles(self) -> List['Tile']:
         config_game_tiles = set(
@@ -121,3 +136,4 @@ class Map:
     def update(self, subject: Any, previous: 'Tile', current: 'Tile'):
         self.__units[previous].remove(subject)
         self.__units[current].append(subject)
+        self.__version += 1
@@ -8,8 +8,10 @@ from config.loader import app_config
 
 
 class Tile(BaseModel):
-    width: ClassVar[float] = app_config.screen.width / app_config.game.tiles.width
-    height: ClassVar[float] = app_config.screen.height / app_config.game.tiles.height
+    width: ClassVar[float] = (app_config.data['app']['screen']['width'] /
+                              app_config.data['app']['game']['tiles']['width'])
+    height: ClassVar[float] = (app_config.data['app']['screen']['height'] /
+                               app_config.data['app']['game']['tiles']['height'])
     x: int
     y: int
     padding: int = 0
@@ -68,6 +68,8 @@ class Unit(pygame.sprite.Sprite):
     def update_pos(self, tile: 'Tile'):
         previous_tile = self.tile
         self.tile = tile
+        # keep rect on the new tile before observers see the move, hit-testing reads it right away
+        self.rect.update(tile.get_rect())
         self.notify(previous_tile, tile)
 
     def subscribe(self, observer: Any):
@@ -1,17 +1,20 @@
 import sys
 
 import pygame
-from pygame import MOUSEBUTTONDOWN
+from pygame import MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION, Color
 from pygame.locals import QUIT
 
 from config.loader import app_config
-from events import EventHandler
-from game.factories import UnitType
-from game.map import Map
 from game.screen import Screen
 
-# 初始化
+# 初始化，先開啟視窗再載入遊戲模組
 screen = Screen(app_config)
+screen.update()
+
+from events import EventHandler  # noqa: E402
+from game.factories import UnitType  # noqa: E402
+from game.map import Map  # noqa: E402
+
 game_map = Map(screen.surface)
 game_map.generate_units(UnitType.BLOCKER)
 game_map.generate_units(UnitType.CHARACTER)
@@ -21,12 +24,24 @@ events_handler = EventHandler()
 while True:
     # 迭代整個事件迴圈，若有符合事件則對應處理
     for event in pygame.event.get():
-        if event.type == MOUSEBUTTONDOWN:
-            events_handler.click(game_map)
+        # 只處理左鍵，右鍵、中鍵與滾輪不影響拖曳與點擊
+        if event.type == MOUSEBUTTONDOWN and event.button == pygame.BUTTON_LEFT:
+            events_handler.press(event.pos)
+        if event.type == MOUSEBUTTONUP and event.button == pygame.BUTTON_LEFT:
+            events_handler.release(game_map, event.pos)
+        if event.type == MOUSEMOTION:
+            events_handler.drag(event.pos)
         # 當使用者結束視窗，程式也結束
         if event.type == QUIT:
             pygame.quit()
             sys.exit()
 
     game_map.show()
+    # 滑鼠停住時單位移動或死亡也要更新 hover，結果在地圖版本不變時會直接沿用
+    events_handler.hover(game_map, pygame.mouse.get_pos())
+    game_map.highlight([unit.rect for unit in events_handler.drag_select(game_map)], Color('orange'))
+    if events_handler.drag_rect:
+        game_map.highlight([events_handler.drag_rect], Color('white'))
+    if events_handler.hovered_unit:
+        game_map.highlight([events_handler.hovered_unit.rect], Color('yellow'))
     screen.update()
@@ -1,5 +1,6 @@
 import pathlib
 import random
+from functools import cache
 from typing import List
 
 import pygame
@@ -9,9 +10,16 @@ __resource_path: pathlib.Path = pathlib.Path(__file__).parent
 __terrains_dir: pathlib.Path = __resource_path / "terrains"
 __characters_dir: pathlib.Path = __resource_path / "characters"
 
-# get all files in the folder
-background_images: List[pathlib.Path] = [image for image in __terrains_dir.glob("*.png")]
-character_images: List[pathlib.Path] = [image for image in __characters_dir.glob("*.png")]
+
+# get all files in the folder on first use instead of at import
+@cache
+def background_images() -> List[pathlib.Path]:
+    return sorted(__terrains_dir.glob("*.png"))
+
+
+@cache
+def character_images() -> List[pathlib.Path]:
+    return sorted(__characters_dir.glob("*.png"))
 
 
 class ImageLoader:
@@ -0,0 +1,42 @@
+"""
+print an import-time breakdown grouped by top level package, e.g.
+
+    python startup.py game.tile events
+"""
+import pathlib
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List
+
+
+def import_times(module: str) -> Dict[str, int] | None:
+    # -X importtime reports "self us | cumulative us | module" per import on stderr
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, cwd=pathlib.Path(__file__).parent)
+    if result.returncode != 0:
+        # show the child's traceback without the importtime noise
+        traceback = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        print(f"{module}: import failed", *traceback, sep="\n", file=sys.stderr)
+        return None
+    times: Dict[str, int] = defaultdict(int)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        times[name.strip().split(".")[0]] += int(self_us)
+    return times
+
+
+def report(modules: List[str]):
+    for module in modules:
+        times = import_times(module)
+        if times is None:
+            continue
+        print(f"{module}: {sum(times.values()) / 1000:.1f} ms")
+        for package, self_us in sorted(times.items(), key=lambda item: item[1], reverse=True)[:10]:
+            print(f"  {package:<24}{self_us / 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    report(sys.argv[1:] or ["config.loader", "game.tile", "events"])